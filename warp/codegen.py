@@ -1565,6 +1565,12 @@ class Adjoint:
         if isinstance(a, ast.UnaryOp) and isinstance(a.op, ast.USub) and isinstance(a.operand, ast.Num):
             return True, -a.operand.n
 
+        # fold integer arithmetic on compile-time constants, e.g.: range(N * 2)
+        if isinstance(a, ast.BinOp):
+            value = adj.fold_int_expression(a)
+            if value is not None:
+                return True, value
+
         # try and resolve the expression to an object
         # e.g.: wp.constant in the globals scope
         obj, _ = adj.resolve_static_expression(a)
@@ -1574,6 +1580,56 @@ class Adjoint:
 
         return warp.types.is_int(obj), obj
 
+    # evaluates an integer expression made only of literals and compile-time constants
+    # (e.g.: wp.constant) without emitting any code, returns None if this is not possible
+    def fold_int_expression(adj, a):
+        if isinstance(a, ast.Num):
+            return a.n if isinstance(a.n, int) and not isinstance(a.n, bool) else None
+
+        if isinstance(a, ast.UnaryOp) and isinstance(a.op, (ast.USub, ast.UAdd)):
+            operand = adj.fold_int_expression(a.operand)
+            if operand is None:
+                return None
+            return -operand if isinstance(a.op, ast.USub) else operand
+
+        if isinstance(a, ast.BinOp):
+            lhs = adj.fold_int_expression(a.left)
+            if lhs is None:
+                return None
+            rhs = adj.fold_int_expression(a.right)
+            if rhs is None:
+                return None
+
+            if isinstance(a.op, ast.Add):
+                return lhs + rhs
+            if isinstance(a.op, ast.Sub):
+                return lhs - rhs
+            if isinstance(a.op, ast.Mult):
+                return lhs * rhs
+
+            # Python rounds integer division towards negative infinity while the generated
+            # code truncates towards zero, so only fold when both agree
+            if isinstance(a.op, ast.FloorDiv) and lhs >= 0 and rhs > 0:
+                return lhs // rhs
+            if isinstance(a.op, ast.Mod) and lhs >= 0 and rhs > 0:
+                return lhs % rhs
+            if isinstance(a.op, ast.LShift) and lhs >= 0 and 0 <= rhs < 32:
+                return lhs << rhs
+            if isinstance(a.op, ast.RShift) and lhs >= 0 and rhs >= 0:
+                return lhs >> rhs
+
+            return None
+
+        if isinstance(a, (ast.Name, ast.Attribute)):
+            obj, _ = adj.resolve_static_expression(a, eval_types=False)
+
+            if isinstance(obj, Var) and obj.constant is not None:
+                obj = obj.constant
+
+            return obj if isinstance(obj, int) and not isinstance(obj, bool) else None
+
+        return None
+
     # detects whether a loop contains a break (or continue) statement
     def contains_break(adj, body):
         for s in body:
@@ -1605,8 +1661,8 @@ class Adjoint:
             return None
 
         # if all range() arguments are numeric constants we will unroll
-        # note that this only handles trivial constants, it will not unroll
-        # constant compile-time expressions e.g.: range(0, 3*2)
+        # note that this includes integer arithmetic on compile-time constants
+        # e.g.: range(0, 3*2) or range(N + 1) where N is a wp.constant
 
         # Evaluate the arguments and check that they are numeric constants
         # It is important to do that in one pass, so that if evaluating these arguments have side effects
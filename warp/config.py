@@ -35,6 +35,10 @@ enable_graph_capture_module_load_by_default: bool = (
     True  # Default value of force_module_load for capture_begin() if CUDA driver does not support at least CUDA 12.3
 )
 
+allow_tf32: bool = (
+    False  # whether wp.matmul() may use TF32 Tensor Core arithmetic for float32 inputs on Ampere and newer GPUs
+)
+
 enable_mempools_at_init: bool = True  # Whether CUDA devices will be initialized with mempools enabled (if supported)
 
 max_unroll: int = 16
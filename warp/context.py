@@ -2644,6 +2644,7 @@ class Runtime:
                 ctypes.c_bool,
                 ctypes.c_bool,
                 ctypes.c_bool,
+                ctypes.c_bool,
                 ctypes.c_int,
             ]
             self.core.cutlass_gemm.restype = ctypes.c_bool
@@ -4544,7 +4545,13 @@ def launch(
 
                 if record_cmd:
                     launch = Launch(
-                        kernel=kernel, hooks=hooks, params=params, params_addr=None, bounds=bounds, device=device
+                        kernel=kernel,
+                        hooks=hooks,
+                        params=params,
+                        params_addr=None,
+                        bounds=bounds,
+                        device=device,
+                        max_blocks=max_blocks,
                     )
                     return launch
                 else:
@@ -4581,6 +4588,7 @@ def launch(
                         params_addr=kernel_params,
                         bounds=bounds,
                         device=device,
+                        max_blocks=max_blocks,
                     )
                     return launch
 
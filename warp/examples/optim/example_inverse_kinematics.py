@@ -107,6 +107,16 @@ class Example:
 
         self.train_rate = 0.01
 
+        # capture forward/backward passes
+        self.use_cuda_graph = wp.get_device().is_cuda
+        if self.use_cuda_graph:
+            with wp.ScopedCapture() as capture:
+                self.tape = wp.Tape()
+                with self.tape:
+                    self.forward()
+                self.tape.backward(loss=self.loss)
+            self.graph = capture.graph
+
     def forward(self):
         wp.sim.eval_fk(self.model, self.model.joint_q, self.model.joint_qd, None, self.state)
 
@@ -114,24 +124,27 @@ class Example:
 
     def step(self):
         with wp.ScopedTimer("step"):
-            tape = wp.Tape()
-            with tape:
-                self.forward()
-            tape.backward(loss=self.loss)
+            if self.use_cuda_graph:
+                wp.capture_launch(self.graph)
+            else:
+                self.tape = wp.Tape()
+                with self.tape:
+                    self.forward()
+                self.tape.backward(loss=self.loss)
 
             if self.verbose:
                 print(f"loss: {self.loss}")
-                print(f"joint_grad: {tape.gradients[self.model.joint_q]}")
+                print(f"joint_grad: {self.tape.gradients[self.model.joint_q]}")
 
             # gradient descent
             wp.launch(
                 step_kernel,
                 dim=len(self.model.joint_q),
-                inputs=[self.model.joint_q, tape.gradients[self.model.joint_q], self.train_rate],
+                inputs=[self.model.joint_q, self.tape.gradients[self.model.joint_q], self.train_rate],
             )
 
             # zero gradients
-            tape.zero()
+            self.tape.zero()
 
     def render(self):
         if self.renderer is None:
@@ -23,6 +23,7 @@ bool cutlass_gemm(
                   float alpha, float beta,
                   bool row_major_a, bool row_major_b,
                   bool allow_tf32x3_arith,
+                  bool allow_tf32_arith,
                   int batch_count)
 {
     printf("CUDA is disabled and/or CUTLASS is disabled.\n");
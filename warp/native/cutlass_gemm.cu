@@ -20,11 +20,21 @@
 
 namespace wp {
 
+// Returns true if the shared memory required by the GEMM kernel fits within the opt-in per-block limit of the current device
 template <typename Gemm>
-bool run_gemm(int m, int n, int k, int batch_count, const void* a, const void* b, const void* c, void* d, float alpha, float beta) {
-    //
-    // Initialize arguments
-    //
+bool gemm_fits_shared_memory() {
+    int device = 0;
+    int max_shared_memory = 0;
+    if (cudaGetDevice(&device) != cudaSuccess ||
+        cudaDeviceGetAttribute(&max_shared_memory, cudaDevAttrMaxSharedMemoryPerBlockOptin, device) != cudaSuccess) {
+        return false;
+    }
+
+    return sizeof(typename Gemm::GemmKernel::SharedStorage) <= size_t(max_shared_memory);
+}
+
+template <typename Gemm>
+typename Gemm::Arguments make_gemm_arguments(int m, int n, int k, int batch_count, const void* a, const void* b, const void* c, void* d, float alpha, float beta) {
     typename Gemm::EpilogueOutputOp::Params epilogue_params(
         (typename Gemm::EpilogueOutputOp::ElementCompute)alpha,
         (typename Gemm::EpilogueOutputOp::ElementCompute)beta);
@@ -39,11 +49,38 @@ bool run_gemm(int m, int n, int k, int batch_count, const void* a, const void* b
         Gemm::LayoutA::packed({m, k}).stride(0), Gemm::LayoutB::packed({k, n}).stride(0), n, n
     };
 
+    return arguments;
+}
+
+// Returns true if the GEMM kernel can run the problem on the current device, i.e. the problem dimensions
+// are multiples of the kernel's vector access widths and its shared memory fits within the device limit
+template <typename Gemm>
+bool gemm_can_implement(int m, int n, int k, int batch_count, const void* a, const void* b, const void* c, void* d, float alpha, float beta) {
+    if (!gemm_fits_shared_memory<Gemm>())
+        return false;
+
+    typename Gemm::Arguments arguments = make_gemm_arguments<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+    return Gemm::can_implement(arguments) == cutlass::Status::kSuccess;
+}
+
+template <typename Gemm>
+bool run_gemm(int m, int n, int k, int batch_count, const void* a, const void* b, const void* c, void* d, float alpha, float beta) {
+    //
+    // Initialize arguments
+    //
+    typename Gemm::Arguments arguments = make_gemm_arguments<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+
+    cutlass::Status status = Gemm::can_implement(arguments);
+    if (status != cutlass::Status::kSuccess) {
+        std::cerr << "GEMM problem not supported: " << cutlass::cutlassGetStatusString(status) << "\n";
+        return false;
+    }
+
     Gemm gemm;
     size_t workspace_size = Gemm::get_workspace_size(arguments);
     ScopedTemporary<> workspace(WP_CURRENT_CONTEXT, workspace_size);
     cudaStream_t stream = static_cast<cudaStream_t>(cuda_stream_get_current());
-    cutlass::Status status = gemm.initialize(arguments, workspace.buffer(), stream);
+    status = gemm.initialize(arguments, workspace.buffer(), stream);
 
     if (status != cutlass::Status::kSuccess) {
         cudaError_t error = cudaGetLastError();
@@ -65,11 +102,14 @@ bool run_gemm(int m, int n, int k, int batch_count, const void* a, const void* b
     return true;
 }
 
+// All configurations rasterize threadblocks in groups of up to 8 tile columns (GemmIdentityThreadblockSwizzle<8>)
+// so that concurrently running threadblocks reuse the same A and B tiles from L2
 template <
     int ComputeCapability,
     typename Element_,
     typename LayoutA,
-    typename LayoutB
+    typename LayoutB,
+    typename MathOperator = cutlass::arch::OpMultiplyAdd
 >
 struct DefaultGemmConfig;
 
@@ -93,14 +133,15 @@ struct DefaultGemmConfig<80, double, LayoutA, LayoutB> {
             1,
             double,
             double>,
-        cutlass::gemm::threadblock::GemmIdentityThreadblockSwizzle<>,   // Swizzling
+        cutlass::gemm::threadblock::GemmIdentityThreadblockSwizzle<8>,  // Swizzling
         3                                                               // Stages
     >;
 };
 
-// Partial specialization for SM80 F32 Tensor Cores
-template <typename LayoutA, typename LayoutB>
-struct DefaultGemmConfig<80, float, LayoutA, LayoutB> {
+// Partial specialization for SM80 F32 Tensor Cores, the math operator selects between
+// 3xTF32 (OpMultiplyAddFastF32) and plain TF32 (OpMultiplyAdd) arithmetic
+template <typename LayoutA, typename LayoutB, typename MathOperator>
+struct DefaultGemmConfig<80, float, LayoutA, LayoutB, MathOperator> {
     using Gemm = cutlass::gemm::device::GemmUniversal<
         float, LayoutA,                                                 // ElementA and LayoutA
         float, LayoutB,                                                 // ElementB and LayoutB
@@ -116,21 +157,21 @@ struct DefaultGemmConfig<80, float, LayoutA, LayoutB> {
             128 / cutlass::sizeof_bits<float>::value,
             float,
             float>,
-        cutlass::gemm::threadblock::GemmIdentityThreadblockSwizzle<>,   // Swizzling
+        cutlass::gemm::threadblock::GemmIdentityThreadblockSwizzle<8>,  // Swizzling
         3,                                                              // Stages
         4, 4,                                                           // AlignmentA and AlignmentB
-        cutlass::arch::OpMultiplyAddFastF32                             // Math mode -- use 3xTF32
+        MathOperator                                                    // Math mode
     >;
 };
 
-// Partial specialization for SM80 F16 Tensor Cores
+// Partial specialization for SM80 F16 Tensor Cores, accumulating in F32
 template <typename LayoutA, typename LayoutB>
 struct DefaultGemmConfig<80, cutlass::half_t, LayoutA, LayoutB> {
     using Gemm = cutlass::gemm::device::GemmUniversal<
         cutlass::half_t, LayoutA,                                       // ElementA and LayoutA
         cutlass::half_t, LayoutB,                                       // ElementB and LayoutB
         cutlass::half_t, cutlass::layout::RowMajor,                     // ElementC and LayoutC
-        cutlass::half_t,                                                // ElementAccumulator
+        float,                                                          // ElementAccumulator
         cutlass::arch::OpClassTensorOp,                                 // Operation type
         cutlass::arch::Sm80,                                            // Architecture
         cutlass::gemm::GemmShape<256, 128, 32>,                         // ThreadblockShape
@@ -139,23 +180,23 @@ struct DefaultGemmConfig<80, cutlass::half_t, LayoutA, LayoutB> {
         cutlass::epilogue::thread::LinearCombination<                   // Epilogue
             cutlass::half_t,
             128 / cutlass::sizeof_bits<cutlass::half_t>::value,
-            cutlass::half_t,
-            cutlass::half_t>,
-        cutlass::gemm::threadblock::GemmIdentityThreadblockSwizzle<>,   // Swizzling
+            float,
+            float>,
+        cutlass::gemm::threadblock::GemmIdentityThreadblockSwizzle<8>,  // Swizzling
         3                                                               // Stages
     >;
 };
 
 //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 
-// Partial specialization for SM75 F16 Tensor Cores
+// Partial specialization for SM75 F16 Tensor Cores, accumulating in F32
 template <typename LayoutA, typename LayoutB>
 struct DefaultGemmConfig<75, cutlass::half_t, LayoutA, LayoutB> {
     using Gemm = cutlass::gemm::device::GemmUniversal<
         cutlass::half_t, LayoutA,                                       // ElementA and LayoutA
         cutlass::half_t, LayoutB,                                       // ElementB and LayoutB
         cutlass::half_t, cutlass::layout::RowMajor,                     // ElementC and LayoutC
-        cutlass::half_t,                                                // ElementAccumulator
+        float,                                                          // ElementAccumulator
         cutlass::arch::OpClassTensorOp,                                 // Operation type
         cutlass::arch::Sm75,                                            // Architecture
         cutlass::gemm::GemmShape<256, 128, 32>,                         // ThreadblockShape
@@ -164,23 +205,23 @@ struct DefaultGemmConfig<75, cutlass::half_t, LayoutA, LayoutB> {
         cutlass::epilogue::thread::LinearCombination<                   // Epilogue
             cutlass::half_t,
             128 / cutlass::sizeof_bits<cutlass::half_t>::value,
-            cutlass::half_t,
-            cutlass::half_t>,
-        cutlass::gemm::threadblock::GemmIdentityThreadblockSwizzle<>,   // Swizzling
+            float,
+            float>,
+        cutlass::gemm::threadblock::GemmIdentityThreadblockSwizzle<8>,  // Swizzling
         2                                                               // Stages
     >;
 };
 
 //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 
-// Partial specialization for SM70 F16 Tensor Cores
+// Partial specialization for SM70 F16 Tensor Cores, accumulating in F32
 template <typename LayoutA, typename LayoutB>
 struct DefaultGemmConfig<70, cutlass::half_t, LayoutA, LayoutB> {
     using Gemm = cutlass::gemm::device::GemmUniversal<
         cutlass::half_t, LayoutA,                                       // ElementA and LayoutA
         cutlass::half_t, LayoutB,                                       // ElementB and LayoutB
         cutlass::half_t, cutlass::layout::RowMajor,                     // ElementC and LayoutC
-        cutlass::half_t,                                                // ElementAccumulator
+        float,                                                          // ElementAccumulator
         cutlass::arch::OpClassTensorOp,                                 // Operation type
         cutlass::arch::Sm70,                                            // Architecture
         cutlass::gemm::GemmShape<256, 128, 32>,                         // ThreadblockShape
@@ -189,9 +230,9 @@ struct DefaultGemmConfig<70, cutlass::half_t, LayoutA, LayoutB> {
         cutlass::epilogue::thread::LinearCombination<                   // Epilogue
             cutlass::half_t,
             128 / cutlass::sizeof_bits<cutlass::half_t>::value,
-            cutlass::half_t,
-            cutlass::half_t>,
-        cutlass::gemm::threadblock::GemmIdentityThreadblockSwizzle<>,   // Swizzling
+            float,
+            float>,
+        cutlass::gemm::threadblock::GemmIdentityThreadblockSwizzle<8>,  // Swizzling
         2                                                               // Stages
     >;
 };
@@ -216,13 +257,47 @@ struct DefaultGemmConfig<50, Element, LayoutA, LayoutB> {
             1,
             Element,
             Element>,
-        cutlass::gemm::threadblock::GemmIdentityThreadblockSwizzle<>,   // Swizzling
+        cutlass::gemm::threadblock::GemmIdentityThreadblockSwizzle<8>,  // Swizzling
         2                                                               // Stages
     >;
 };
 
 //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 
+template <
+    int ComputeCapability,
+    typename Element_,
+    typename LayoutA,
+    typename LayoutB
+>
+struct DefaultSimtGemmConfig;
+
+// Partial specialization for SM80 F32 SIMT, loads of the next K-blocks are issued with cp.async
+// while the current one is computed (multistage pipeline) instead of going through registers
+template <typename LayoutA, typename LayoutB>
+struct DefaultSimtGemmConfig<80, float, LayoutA, LayoutB> {
+    using Gemm = cutlass::gemm::device::GemmUniversal<
+        float, LayoutA,                                                 // ElementA and LayoutA
+        float, LayoutB,                                                 // ElementB and LayoutB
+        float, cutlass::layout::RowMajor,                               // ElementC and LayoutC
+        float,                                                          // ElementAccumulator
+        cutlass::arch::OpClassSimt,                                     // Operation type
+        cutlass::arch::Sm80,                                            // Architecture
+        cutlass::gemm::GemmShape<128, 128, 8>,                          // ThreadblockShape
+        cutlass::gemm::GemmShape<32, 64, 8>,                            // WarpShape
+        cutlass::gemm::GemmShape<1, 1, 1>,                              // Instruction Shape
+        cutlass::epilogue::thread::LinearCombination<                   // Epilogue
+            float,
+            1,
+            float,
+            float>,
+        cutlass::gemm::threadblock::GemmIdentityThreadblockSwizzle<8>,  // Swizzling
+        4                                                               // Stages
+    >;
+};
+
+//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
 extern "C" {
 
 WP_API
@@ -234,92 +309,133 @@ bool cutlass_gemm(
                   float alpha, float beta,
                   bool row_major_a, bool row_major_b,
                   bool allow_tf32x3_arith,
+                  bool allow_tf32_arith,
                   int batch_count) {
 
     std::string datatype(datatype_str);
 
     ContextGuard guard(context);
 
-    // Specializations for using Tensor Cores and A/B RowMajor/ColumnMajor designations
-    if (compute_capability == 80) {
+    // Specializations for using Tensor Cores and A/B RowMajor/ColumnMajor designations,
+    // newer architectures run the kernels of the closest supported one (e.g. SM86/SM89/SM90 use SM80)
+    if (compute_capability >= 80) {
         if (datatype == F64_STR) {
             if (row_major_a && row_major_b) {
                 using Gemm = DefaultGemmConfig<80, double, cutlass::layout::RowMajor, cutlass::layout::RowMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (!row_major_a && row_major_b) {
                 using Gemm = DefaultGemmConfig<80, double, cutlass::layout::ColumnMajor, cutlass::layout::RowMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (row_major_a && !row_major_b) {
                 using Gemm = DefaultGemmConfig<80, double, cutlass::layout::RowMajor, cutlass::layout::ColumnMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (!row_major_a && !row_major_b) {
                 using Gemm = DefaultGemmConfig<80, double, cutlass::layout::ColumnMajor, cutlass::layout::ColumnMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             }
         } else if (datatype == F32_STR && allow_tf32x3_arith) {
+            if (row_major_a && row_major_b) {
+                using Gemm = DefaultGemmConfig<80, float, cutlass::layout::RowMajor, cutlass::layout::RowMajor, cutlass::arch::OpMultiplyAddFastF32>::Gemm;
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+            } else if (!row_major_a && row_major_b) {
+                using Gemm = DefaultGemmConfig<80, float, cutlass::layout::ColumnMajor, cutlass::layout::RowMajor, cutlass::arch::OpMultiplyAddFastF32>::Gemm;
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+            } else if (row_major_a && !row_major_b) {
+                using Gemm = DefaultGemmConfig<80, float, cutlass::layout::RowMajor, cutlass::layout::ColumnMajor, cutlass::arch::OpMultiplyAddFastF32>::Gemm;
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+            } else if (!row_major_a && !row_major_b) {
+                using Gemm = DefaultGemmConfig<80, float, cutlass::layout::ColumnMajor, cutlass::layout::ColumnMajor, cutlass::arch::OpMultiplyAddFastF32>::Gemm;
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+            }
+        } else if (datatype == F32_STR && allow_tf32_arith) {
             if (row_major_a && row_major_b) {
                 using Gemm = DefaultGemmConfig<80, float, cutlass::layout::RowMajor, cutlass::layout::RowMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (!row_major_a && row_major_b) {
                 using Gemm = DefaultGemmConfig<80, float, cutlass::layout::ColumnMajor, cutlass::layout::RowMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (row_major_a && !row_major_b) {
                 using Gemm = DefaultGemmConfig<80, float, cutlass::layout::RowMajor, cutlass::layout::ColumnMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (!row_major_a && !row_major_b) {
                 using Gemm = DefaultGemmConfig<80, float, cutlass::layout::ColumnMajor, cutlass::layout::ColumnMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             }
         } else if (datatype == F16_STR) {
             if (row_major_a && row_major_b) {
                 using Gemm = DefaultGemmConfig<80, cutlass::half_t, cutlass::layout::RowMajor, cutlass::layout::RowMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (!row_major_a && row_major_b) {
                 using Gemm = DefaultGemmConfig<80, cutlass::half_t, cutlass::layout::ColumnMajor, cutlass::layout::RowMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (row_major_a && !row_major_b) {
                 using Gemm = DefaultGemmConfig<80, cutlass::half_t, cutlass::layout::RowMajor, cutlass::layout::ColumnMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (!row_major_a && !row_major_b) {
                 using Gemm = DefaultGemmConfig<80, cutlass::half_t, cutlass::layout::ColumnMajor, cutlass::layout::ColumnMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             }
         }
-    } else if (compute_capability == 75) {
+    } else if (compute_capability >= 75) {
         if (datatype == F16_STR) {
             if (row_major_a && row_major_b) {
                 using Gemm = DefaultGemmConfig<75, cutlass::half_t, cutlass::layout::RowMajor, cutlass::layout::RowMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);    
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (!row_major_a && row_major_b) {
                 using Gemm = DefaultGemmConfig<75, cutlass::half_t, cutlass::layout::ColumnMajor, cutlass::layout::RowMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);    
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (row_major_a && !row_major_b) {
                 using Gemm = DefaultGemmConfig<75, cutlass::half_t, cutlass::layout::RowMajor, cutlass::layout::ColumnMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);    
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (!row_major_a && !row_major_b) {
                 using Gemm = DefaultGemmConfig<75, cutlass::half_t, cutlass::layout::ColumnMajor, cutlass::layout::ColumnMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);    
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             }
         }
-    } else if (compute_capability == 70) {
+    } else if (compute_capability >= 70) {
         if (datatype == F16_STR) {
             if (row_major_a && row_major_b) {
                 using Gemm = DefaultGemmConfig<70, cutlass::half_t, cutlass::layout::RowMajor, cutlass::layout::RowMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (!row_major_a && row_major_b) {
                 using Gemm = DefaultGemmConfig<70, cutlass::half_t, cutlass::layout::ColumnMajor, cutlass::layout::RowMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (row_major_a && !row_major_b) {
                 using Gemm = DefaultGemmConfig<70, cutlass::half_t, cutlass::layout::RowMajor, cutlass::layout::ColumnMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             } else if (!row_major_a && !row_major_b) {
                 using Gemm = DefaultGemmConfig<70, cutlass::half_t, cutlass::layout::ColumnMajor, cutlass::layout::ColumnMajor>::Gemm;
-                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+                if (gemm_can_implement<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta))
+                    return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
             }
         }
     }
 
-    // No Tensor Core capability available. Run a SIMT kernel
+    // No Tensor Core capability available, or the Tensor Core kernel cannot implement the problem (misaligned
+    // dimensions or not enough shared memory on the device). Run a SIMT kernel, which has no alignment requirements
     if (datatype == F64_STR) {
         if (row_major_a && row_major_b) {
             using Gemm = DefaultGemmConfig<50, double, cutlass::layout::RowMajor, cutlass::layout::RowMajor>::Gemm;
@@ -335,6 +451,22 @@ bool cutlass_gemm(
             return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
         }
     } else if (datatype == F32_STR) {
+        if (compute_capability >= 80) {
+            if (row_major_a && row_major_b) {
+                using Gemm = DefaultSimtGemmConfig<80, float, cutlass::layout::RowMajor, cutlass::layout::RowMajor>::Gemm;
+                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+            } else if (!row_major_a && row_major_b) {
+                using Gemm = DefaultSimtGemmConfig<80, float, cutlass::layout::ColumnMajor, cutlass::layout::RowMajor>::Gemm;
+                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+            } else if (row_major_a && !row_major_b) {
+                using Gemm = DefaultSimtGemmConfig<80, float, cutlass::layout::RowMajor, cutlass::layout::ColumnMajor>::Gemm;
+                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+            } else if (!row_major_a && !row_major_b) {
+                using Gemm = DefaultSimtGemmConfig<80, float, cutlass::layout::ColumnMajor, cutlass::layout::ColumnMajor>::Gemm;
+                return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
+            }
+        }
+
         if (row_major_a && row_major_b) {
             using Gemm = DefaultGemmConfig<50, float, cutlass::layout::RowMajor, cutlass::layout::RowMajor>::Gemm;
             return run_gemm<Gemm>(m, n, k, batch_count, a, b, c, d, alpha, beta);
@@ -210,6 +210,56 @@ CUDA_CALLABLE inline void adj_dense_solve(int n,
 }
 
 
+// accumulates value into *addr, when a full warp targets the same address the values are
+// first summed with warp shuffles so that a single atomic is issued instead of 32
+CUDA_CALLABLE inline void mlp_atomic_add(float* addr, float value)
+{
+#if defined(__CUDA_ARCH__)
+    unsigned int mask;
+    asm volatile("activemask.b32 %0;" : "=r"(mask));
+
+    if (mask == 0xffffffff)
+    {
+        // check every lane accumulates to the address of lane 0
+        const unsigned long long addr_bits = reinterpret_cast<unsigned long long>(addr);
+        unsigned int lo = unsigned(addr_bits);
+        unsigned int hi = unsigned(addr_bits >> 32);
+        asm volatile("shfl.sync.idx.b32 %0, %0, 0, 0x1f, 0xffffffff;" : "+r"(lo));
+        asm volatile("shfl.sync.idx.b32 %0, %0, 0, 0x1f, 0xffffffff;" : "+r"(hi));
+
+        unsigned int uniform;
+        asm volatile("{\n\t"
+                     ".reg .pred p;\n\t"
+                     "setp.eq.u64 p, %1, %2;\n\t"
+                     "vote.sync.all.pred p, p, 0xffffffff;\n\t"
+                     "selp.u32 %0, 1, 0, p;\n\t"
+                     "}"
+                     : "=r"(uniform)
+                     : "l"(addr_bits), "l"((static_cast<unsigned long long>(hi) << 32) | lo));
+
+        if (uniform)
+        {
+            for (int offset=16; offset > 0; offset /= 2)
+            {
+                float other;
+                asm volatile("shfl.sync.down.b32 %0, %1, %2, 0x1f, 0xffffffff;" : "=f"(other) : "f"(value), "r"(offset));
+                value += other;
+            }
+
+            unsigned int lane;
+            asm volatile("mov.u32 %0, %%laneid;" : "=r"(lane));
+
+            if (lane == 0)
+                atomic_add(addr, value);
+
+            return;
+        }
+    }
+#endif
+
+    atomic_add(addr, value);
+}
+
 template <typename F>
 CUDA_CALLABLE inline void mlp(const array_t<float>& weights, const array_t<float>& bias, F activation, int index, const array_t<float>& x, array_t<float>& out)
 {
@@ -258,7 +308,7 @@ CUDA_CALLABLE inline void adj_mlp(const array_t<float>& weights, const array_t<f
         {
             // adjoint w.r.t M_i
             if (adj_weights.data)
-                atomic_add(&adj_weights.data[i*n + j], x.data[index + b*j]*adj_f);    // todo: reduce these atomic stores using warp/block level reductions
+                mlp_atomic_add(&adj_weights.data[i*n + j], x.data[index + b*j]*adj_f);
 
             // adjoint w.r.t x
             if (adj_x.data)
@@ -267,7 +317,7 @@ CUDA_CALLABLE inline void adj_mlp(const array_t<float>& weights, const array_t<f
 
         // adjoint w.r.t b
         if (adj_bias.data)
-            atomic_add(&adj_bias.data[i], adj_f);
+            mlp_atomic_add(&adj_bias.data[i], adj_f);
 
     }
 }
@@ -98,6 +98,23 @@ template <typename T> struct cub_strided_iterator
     }
 };
 
+/// Sums `count` values for each of the `type_length` inputs returned by `make_input(k)` into `ptr_out[k]`,
+/// sharing a single CUB temporary buffer between the reductions
+template <typename T, typename MakeInputIterator>
+void cub_sum_inputs(MakeInputIterator make_input, T *ptr_out, int count, int type_length, cudaStream_t stream)
+{
+    size_t buff_size = 0;
+    check_cuda(cub::DeviceReduce::Sum(nullptr, buff_size, make_input(0), ptr_out, count, stream));
+    void* temp_buffer = alloc_device(WP_CURRENT_CONTEXT, buff_size);
+
+    for (int k = 0; k < type_length; ++k)
+    {
+        check_cuda(cub::DeviceReduce::Sum(temp_buffer, buff_size, make_input(k), ptr_out + k, count, stream));
+    }
+
+    free_device(WP_CURRENT_CONTEXT, temp_buffer);
+}
+
 template <typename T> void array_sum_device(const T *ptr_a, T *ptr_out, int count, int byte_stride, int type_length)
 {
     assert((byte_stride % sizeof(T)) == 0);
@@ -106,19 +123,16 @@ template <typename T> void array_sum_device(const T *ptr_a, T *ptr_out, int coun
     ContextGuard guard(cuda_context_get_current());
     cudaStream_t stream = static_cast<cudaStream_t>(cuda_stream_get_current());
 
-    cub_strided_iterator<const T> ptr_strided{ptr_a, stride};
-
-    size_t buff_size = 0;
-    check_cuda(cub::DeviceReduce::Sum(nullptr, buff_size, ptr_strided, ptr_out, count, stream));
-    void* temp_buffer = alloc_device(WP_CURRENT_CONTEXT, buff_size);
-
-    for (int k = 0; k < type_length; ++k)
+    if (stride == 1 && type_length == 1)
     {
-        cub_strided_iterator<const T> ptr_strided{ptr_a + k, stride};
-        check_cuda(cub::DeviceReduce::Sum(temp_buffer, buff_size, ptr_strided, ptr_out + k, count, stream));
+        // contiguous scalars, reading through the raw pointer lets CUB issue vectorized loads
+        cub_sum_inputs([ptr_a](int) { return ptr_a; }, ptr_out, count, 1, stream);
+    }
+    else
+    {
+        cub_sum_inputs([ptr_a, stride](int k) { return cub_strided_iterator<const T>{ptr_a + k, stride}; }, ptr_out,
+                       count, type_length, stream);
     }
-
-    free_device(WP_CURRENT_CONTEXT, temp_buffer);
 }
 
 template <typename T>
@@ -95,7 +95,8 @@ extern "C"
 
     WP_API bool cutlass_gemm(void* context, int compute_capability, int m, int n, int k, const char* datatype,
                              const void* a, const void* b, const void* c, void* d, float alpha, float beta,
-                             bool row_major_a, bool row_major_b, bool allow_tf32x3_arith, int batch_count);
+                             bool row_major_a, bool row_major_b, bool allow_tf32x3_arith, bool allow_tf32_arith,
+                             int batch_count);
 
     WP_API uint64_t volume_create_host(void* buf, uint64_t size, bool copy, bool owner);
     WP_API void volume_get_tiles_host(uint64_t id, void* buf);
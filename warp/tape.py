@@ -112,17 +112,6 @@ class Tape:
                 launch()
 
             else:
-                # kernel option takes precedence over module option
-                kernel_enable_backward = launch[0].options.get("enable_backward")
-                if kernel_enable_backward is False:
-                    msg = f"Running the tape backwards may produce incorrect gradients because recorded kernel {launch[0].key} is configured with the option 'enable_backward=False'."
-                    wp.utils.warn(msg)
-                elif kernel_enable_backward is None:
-                    module_enable_backward = launch[0].module.options.get("enable_backward")
-                    if module_enable_backward is False:
-                        msg = f"Running the tape backwards may produce incorrect gradients because recorded kernel {launch[0].key} is defined in a module with the option 'enable_backward=False' set."
-                        wp.utils.warn(msg)
-
                 kernel = launch[0]
                 dim = launch[1]
                 max_blocks = launch[2]
@@ -141,6 +130,25 @@ class Tape:
                 for a in outputs:
                     adj_outputs.append(self.get_adjoint(a))
 
+                # skip launches that have no gradients to propagate, e.g.: kernels operating
+                # only on arrays without requires_grad=True and on non-differentiable arguments
+                if not any(
+                    wp.types.is_array(adj) or isinstance(adj, wp.codegen.StructInstance)
+                    for adj in (*adj_inputs, *adj_outputs)
+                ):
+                    continue
+
+                # kernel option takes precedence over module option
+                kernel_enable_backward = launch[0].options.get("enable_backward")
+                if kernel_enable_backward is False:
+                    msg = f"Running the tape backwards may produce incorrect gradients because recorded kernel {launch[0].key} is configured with the option 'enable_backward=False'."
+                    wp.utils.warn(msg)
+                elif kernel_enable_backward is None:
+                    module_enable_backward = launch[0].module.options.get("enable_backward")
+                    if module_enable_backward is False:
+                        msg = f"Running the tape backwards may produce incorrect gradients because recorded kernel {launch[0].key} is defined in a module with the option 'enable_backward=False' set."
+                        wp.utils.warn(msg)
+
                 wp.launch(
                     kernel=kernel,
                     dim=dim,
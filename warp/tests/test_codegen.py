@@ -309,6 +309,33 @@ def test_range_constant():
     wp.expect_eq(s, -3)
 
 
+# test unrolling of loops whose bounds are integer expressions of constants
+# note that `s = 0` declares a constant, mutating it is only legal inside unrolled
+# loops, so this kernel fails to compile if any of these ranges are not folded
+@wp.kernel
+def test_range_constant_expression():
+    s = 0
+    for i in range(upper * 2):
+        s += i
+
+    # sum [0, 6)
+    wp.expect_eq(s, 15)
+
+    s = 0
+    for i in range(lower + 1, upper - 1):
+        s += i
+
+    # sum [-2, 2)
+    wp.expect_eq(s, -2)
+
+    s = 0
+    for i in range(0, (upper + 5) // step, upper % step):
+        s += i
+
+    # sum [0, 4)
+    wp.expect_eq(s, 6)
+
+
 N = wp.constant(3)
 
 
@@ -514,6 +541,13 @@ add_kernel_test(
     devices=devices,
 )
 add_kernel_test(TestCodeGen, name="test_range_constant", kernel=test_range_constant, dim=1, devices=devices)
+add_kernel_test(
+    TestCodeGen,
+    name="test_range_constant_expression",
+    kernel=test_range_constant_expression,
+    dim=1,
+    devices=devices,
+)
 add_kernel_test(
     TestCodeGen,
     name="test_range_constant_dynamic_nested",
@@ -274,6 +274,30 @@ def test_launch_cmd_empty(test, device):
     assert_np_equal(out.numpy(), ref)
 
 
+@wp.kernel
+def count_elements(count: wp.array(dtype=int)):
+    wp.atomic_add(count, 0, 1)
+
+
+def test_launch_cmd_max_blocks(test, device):
+    n = 1000
+
+    count = wp.zeros(1, dtype=int, device=device)
+
+    # a single block of threads loops over all elements
+    cmd = wp.launch(count_elements, dim=n, inputs=[count], device=device, record_cmd=True, max_blocks=1)
+    test.assertEqual(cmd.max_blocks, 1)
+
+    cmd.launch()
+    test.assertEqual(count.numpy()[0], n)
+
+    count.zero_()
+
+    cmd.set_dim(n // 2)
+    cmd.launch()
+    test.assertEqual(count.numpy()[0], n // 2)
+
+
 @wp.kernel
 def kernel_mul(
     values: wp.array(dtype=int),
@@ -343,6 +367,7 @@ add_function_test(TestLaunch, "test_launch_cmd_set_param", test_launch_cmd_set_p
 add_function_test(TestLaunch, "test_launch_cmd_set_ctype", test_launch_cmd_set_ctype, devices=devices)
 add_function_test(TestLaunch, "test_launch_cmd_set_dim", test_launch_cmd_set_dim, devices=devices)
 add_function_test(TestLaunch, "test_launch_cmd_empty", test_launch_cmd_empty, devices=devices)
+add_function_test(TestLaunch, "test_launch_cmd_max_blocks", test_launch_cmd_max_blocks, devices=devices)
 
 add_function_test(TestLaunch, "test_launch_tuple_args", test_launch_tuple_args, devices=devices)
 
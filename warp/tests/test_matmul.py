@@ -78,12 +78,15 @@ class gemm_test_bed_runner:
                 wp.matmul(A, B, C, D, alpha, beta, False)
             tape.backward(grads={D: ones})
 
-            D_np = alpha * (A.numpy() @ B.numpy()) + beta * C.numpy()
+            # copy the inputs to the host once for the reference computation
+            A_np, B_np, C_np, ones_np = A.numpy(), B.numpy(), C.numpy(), ones.numpy()
+
+            D_np = alpha * (A_np @ B_np) + beta * C_np
             assert_np_equal(D.numpy(), D_np)
 
-            adj_A_np = alpha * np.matmul(ones.numpy(), B.numpy().transpose())
-            adj_B_np = alpha * (A.numpy().transpose() @ ones.numpy())
-            adj_C_np = beta * ones.numpy()
+            adj_A_np = alpha * np.matmul(ones_np, B_np.transpose())
+            adj_B_np = alpha * (A_np.transpose() @ ones_np)
+            adj_C_np = beta * ones_np
 
         else:
             tape = wp.Tape()
@@ -91,12 +94,15 @@ class gemm_test_bed_runner:
                 wp.batched_matmul(A, B, C, D, alpha, beta, False)
             tape.backward(grads={D: ones})
 
-            D_np = alpha * np.matmul(A.numpy(), B.numpy()) + beta * C.numpy()
+            # copy the inputs to the host once for the reference computation
+            A_np, B_np, C_np, ones_np = A.numpy(), B.numpy(), C.numpy(), ones.numpy()
+
+            D_np = alpha * np.matmul(A_np, B_np) + beta * C_np
             assert_np_equal(D.numpy(), D_np)
 
-            adj_A_np = alpha * np.matmul(ones.numpy(), B.numpy().transpose((0, 2, 1)))
-            adj_B_np = alpha * np.matmul(A.numpy().transpose((0, 2, 1)), ones.numpy())
-            adj_C_np = beta * ones.numpy()
+            adj_A_np = alpha * np.matmul(ones_np, B_np.transpose((0, 2, 1)))
+            adj_B_np = alpha * np.matmul(A_np.transpose((0, 2, 1)), ones_np)
+            adj_C_np = beta * ones_np
 
         assert_np_equal(A.grad.numpy(), adj_A_np)
         assert_np_equal(B.grad.numpy(), adj_B_np)
@@ -200,14 +206,17 @@ class gemm_test_bed_runner_transpose:
                 wp.matmul(ATT2, BTT2, C3, D3, alpha, beta, False)
             tape.backward(grads={D1: ones1, D2: ones2, D3: ones3})
 
-            D_np = alpha * (A.numpy() @ B.numpy()) + beta * C1.numpy()
+            # copy the inputs to the host once for the reference computation
+            A_np, B_np, C_np, ones_np = A.numpy(), B.numpy(), C1.numpy(), ones1.numpy()
+
+            D_np = alpha * (A_np @ B_np) + beta * C_np
             assert_np_equal(D1.numpy(), D_np)
             assert_np_equal(D2.numpy(), D_np)
             assert_np_equal(D3.numpy(), D_np)
 
-            adj_A_np = alpha * (ones1.numpy() @ B.numpy().transpose())
-            adj_B_np = alpha * (A.numpy().transpose() @ ones1.numpy())
-            adj_C_np = beta * ones1.numpy()
+            adj_A_np = alpha * (ones_np @ B_np.transpose())
+            adj_B_np = alpha * (A_np.transpose() @ ones_np)
+            adj_C_np = beta * ones_np
 
         else:
             ATT1 = AT1.transpose([0, 2, 1])
@@ -221,14 +230,17 @@ class gemm_test_bed_runner_transpose:
                 wp.batched_matmul(ATT2, BTT2, C3, D3, alpha, beta, False)
             tape.backward(grads={D1: ones1, D2: ones2, D3: ones3})
 
-            D_np = alpha * np.matmul(A.numpy(), B.numpy()) + beta * C1.numpy()
+            # copy the inputs to the host once for the reference computation
+            A_np, B_np, C_np, ones_np = A.numpy(), B.numpy(), C1.numpy(), ones1.numpy()
+
+            D_np = alpha * np.matmul(A_np, B_np) + beta * C_np
             assert_np_equal(D1.numpy(), D_np)
             assert_np_equal(D2.numpy(), D_np)
             assert_np_equal(D3.numpy(), D_np)
 
-            adj_A_np = alpha * np.matmul(ones1.numpy(), B.numpy().transpose((0, 2, 1)))
-            adj_B_np = alpha * np.matmul(A.numpy().transpose((0, 2, 1)), ones1.numpy())
-            adj_C_np = beta * ones1.numpy()
+            adj_A_np = alpha * np.matmul(ones_np, B_np.transpose((0, 2, 1)))
+            adj_B_np = alpha * np.matmul(A_np.transpose((0, 2, 1)), ones_np)
+            adj_C_np = beta * ones_np
 
         assert_np_equal(A.grad.numpy(), adj_A_np)
         assert_np_equal(ATT1.grad.numpy(), adj_A_np)
@@ -253,17 +265,89 @@ class gemm_test_bed_runner_transpose:
 
 
 # NOTE: F16 tests are slow due to the performance of the reference numpy F16 matmuls performed on CPU.
+@unittest.skipUnless(wp.context.runtime.core.is_cutlass_enabled(), "Warp was not built with CUTLASS support")
 def test_f16(test, device):
     gemm_test_bed_runner(wp.float16, device).run()
     gemm_test_bed_runner_transpose(wp.float16, device).run()
 
 
+@unittest.skipUnless(wp.context.runtime.core.is_cutlass_enabled(), "Warp was not built with CUTLASS support")
+def test_f16_accumulation(test, device):
+    if device.is_cuda and device.arch < 70:
+        test.skipTest("F16 SIMT kernels accumulate in F16")
+
+    # with a long K the sums reach the range where the F16 spacing is larger than the summands,
+    # an F16 accumulator is off by several percent while an F32 accumulator stays within the F16 output rounding
+    m = 16
+    n = 16
+    k = 4096
+
+    rng = np.random.default_rng(42)
+    A_np = rng.uniform(size=(m, k)).astype(np.float16)
+    B_np = rng.uniform(size=(k, n)).astype(np.float16)
+
+    A = wp.array(A_np, dtype=wp.float16, device=device)
+    B = wp.array(B_np, dtype=wp.float16, device=device)
+    C = wp.zeros((m, n), dtype=wp.float16, device=device)
+    D = wp.zeros((m, n), dtype=wp.float16, device=device)
+    wp.matmul(A, B, C, D)
+
+    D_ref = np.matmul(A_np.astype(np.float32), B_np.astype(np.float32))
+    rel_err = np.max(np.abs(D.numpy().astype(np.float32) - D_ref) / D_ref)
+    test.assertLess(rel_err, 1.0e-3)
+
+
 @unittest.skipUnless(wp.context.runtime.core.is_cutlass_enabled(), "Warp was not built with CUTLASS support")
 def test_f32(test, device):
     gemm_test_bed_runner(wp.float32, device).run()
     gemm_test_bed_runner_transpose(wp.float32, device).run()
 
 
+@unittest.skipUnless(wp.context.runtime.core.is_cutlass_enabled(), "Warp was not built with CUTLASS support")
+def test_f32_allow_tf32(test, device):
+    # the test bed uses small integer inputs, which are represented exactly in TF32,
+    # so these runs only check that the results stay correct, not which kernel was chosen
+    saved_allow_tf32 = wp.config.allow_tf32
+    wp.config.allow_tf32 = True
+    try:
+        gemm_test_bed_runner(wp.float32, device).run()
+        gemm_test_bed_runner_transpose(wp.float32, device).run()
+
+        # non-integer inputs are rounded to a 10-bit mantissa by TF32 Tensor Cores
+        rng = np.random.default_rng(42)
+        A_np = rng.uniform(size=(64, 256)).astype(np.float32)
+        B_np = rng.uniform(size=(256, 64)).astype(np.float32)
+        A = wp.array(A_np, dtype=wp.float32, device=device)
+        B = wp.array(B_np, dtype=wp.float32, device=device)
+        C = wp.zeros((64, 64), dtype=wp.float32, device=device)
+        D = wp.zeros((64, 64), dtype=wp.float32, device=device)
+        wp.matmul(A, B, C, D)
+
+        D_ref = np.matmul(A_np.astype(np.float64), B_np.astype(np.float64))
+        rel_err = np.max(np.abs(D.numpy() - D_ref) / D_ref)
+        test.assertLess(rel_err, 1.0e-2)
+
+        # on Ampere and newer the TF32 kernel is used, its error is well above what FP32 arithmetic gives
+        if device.is_cuda and device.arch >= 80:
+            test.assertGreater(rel_err, 1.0e-5)
+    finally:
+        wp.config.allow_tf32 = saved_allow_tf32
+
+
+@unittest.skipUnless(wp.context.runtime.core.is_cutlass_enabled(), "Warp was not built with CUTLASS support")
+def test_unaligned(test, device):
+    # dimensions that are not multiples of the Tensor Core kernels' vector access widths
+    saved_allow_tf32 = wp.config.allow_tf32
+    wp.config.allow_tf32 = True
+    try:
+        for dtype in (wp.float32, wp.float64):
+            runner = gemm_test_bed_runner(dtype, device)
+            for batch_count in (1, 3):
+                runner.run_and_verify(13, 17, 7, batch_count, 1.0, 1.0)
+    finally:
+        wp.config.allow_tf32 = saved_allow_tf32
+
+
 @unittest.skipUnless(wp.context.runtime.core.is_cutlass_enabled(), "Warp was not built with CUTLASS support")
 def test_f64(test, device):
     gemm_test_bed_runner(wp.float64, device).run()
@@ -360,47 +444,52 @@ def test_large_batch_count(test, device):
     m = 2
     n = 3
     k = 4
-    batch_count = 65535 * 2 + int(65535 / 2)
-    A = wp.array3d(
-        np.ceil(rng.uniform(low=low, high=high, size=(batch_count, m, k))),
-        dtype=float,
-        device=device,
-        requires_grad=True,
-    )
-    B = wp.array3d(
-        np.ceil(rng.uniform(low=low, high=high, size=(batch_count, k, n))),
-        dtype=float,
-        device=device,
-        requires_grad=True,
-    )
-    C = wp.array3d(
-        np.ceil(rng.uniform(low=low, high=high, size=(batch_count, m, n))),
-        dtype=float,
-        device=device,
-        requires_grad=True,
-    )
-    D = wp.array3d(np.zeros((batch_count, m, n)), dtype=float, device=device, requires_grad=True)
-    ones = wp.zeros_like(D)
-    ones.fill_(1.0)
 
-    alpha = 1.0
-    beta = 1.0
+    # batch counts with and without a partial final chunk of the 65535 batch limit
+    for batch_count in (65535 * 2 + int(65535 / 2), 65535 * 2):
+        A = wp.array3d(
+            np.ceil(rng.uniform(low=low, high=high, size=(batch_count, m, k))),
+            dtype=float,
+            device=device,
+            requires_grad=True,
+        )
+        B = wp.array3d(
+            np.ceil(rng.uniform(low=low, high=high, size=(batch_count, k, n))),
+            dtype=float,
+            device=device,
+            requires_grad=True,
+        )
+        C = wp.array3d(
+            np.ceil(rng.uniform(low=low, high=high, size=(batch_count, m, n))),
+            dtype=float,
+            device=device,
+            requires_grad=True,
+        )
+        D = wp.array3d(np.zeros((batch_count, m, n)), dtype=float, device=device, requires_grad=True)
+        ones = wp.zeros_like(D)
+        ones.fill_(1.0)
 
-    tape = wp.Tape()
-    with tape:
-        wp.batched_matmul(A, B, C, D, alpha=alpha, beta=beta, allow_tf32x3_arith=False)
-    tape.backward(grads={D: ones})
+        alpha = 1.0
+        beta = 1.0
+
+        tape = wp.Tape()
+        with tape:
+            wp.batched_matmul(A, B, C, D, alpha=alpha, beta=beta, allow_tf32x3_arith=False)
+        tape.backward(grads={D: ones})
 
-    D_np = alpha * np.matmul(A.numpy(), B.numpy()) + beta * C.numpy()
-    assert_np_equal(D.numpy(), D_np)
+        # copy the inputs to the host once for the reference computation
+        A_np, B_np, C_np, ones_np = A.numpy(), B.numpy(), C.numpy(), ones.numpy()
 
-    adj_A_np = alpha * np.matmul(ones.numpy(), B.numpy().transpose((0, 2, 1)))
-    adj_B_np = alpha * np.matmul(A.numpy().transpose((0, 2, 1)), ones.numpy())
-    adj_C_np = beta * ones.numpy()
+        D_np = alpha * np.matmul(A_np, B_np) + beta * C_np
+        assert_np_equal(D.numpy(), D_np)
 
-    assert_np_equal(A.grad.numpy(), adj_A_np)
-    assert_np_equal(B.grad.numpy(), adj_B_np)
-    assert_np_equal(C.grad.numpy(), adj_C_np)
+        adj_A_np = alpha * np.matmul(ones_np, B_np.transpose((0, 2, 1)))
+        adj_B_np = alpha * np.matmul(A_np.transpose((0, 2, 1)), ones_np)
+        adj_C_np = beta * ones_np
+
+        assert_np_equal(A.grad.numpy(), adj_A_np)
+        assert_np_equal(B.grad.numpy(), adj_B_np)
+        assert_np_equal(C.grad.numpy(), adj_C_np)
 
 
 @unittest.skipUnless(wp.context.runtime.core.is_cutlass_enabled(), "Warp was not built with CUTLASS support")
@@ -475,6 +564,41 @@ def test_cuda_graph_capture(test, device):
         assert_np_equal(A.grad.numpy(), 8.0 * np.ones((m, n), dtype=wp.types.warp_type_to_np_dtype[dtype]))
 
 
+@unittest.skipUnless(wp.context.runtime.core.is_cutlass_enabled(), "Warp was not built with CUTLASS support")
+def test_beta_zero_ignores_c(test, device):
+    # with beta == 0 the epilogue does not read C, so non-finite values in C must not reach D
+    a_np = np.ones(shape=(2, 3, 4))
+    b_np = np.ones(shape=(2, 4, 5))
+    c_np = np.full(shape=(2, 3, 5), fill_value=np.nan)
+
+    a = wp.array2d(a_np[0], dtype=float, device=device)
+    b = wp.array2d(b_np[0], dtype=float, device=device)
+    c = wp.array2d(c_np[0], dtype=float, device=device)
+    d = wp.zeros_like(c)
+
+    wp.matmul(a, b, c, d, alpha=1.0, beta=0.0)
+    assert_np_equal(d.numpy(), 4.0 * np.ones(shape=(3, 5)))
+
+    a = wp.array3d(a_np, dtype=float, device=device)
+    b = wp.array3d(b_np, dtype=float, device=device)
+    c = wp.array3d(c_np, dtype=float, device=device)
+    d = wp.zeros_like(c)
+
+    wp.batched_matmul(a, b, c, d, alpha=1.0, beta=0.0)
+    assert_np_equal(d.numpy(), 4.0 * np.ones(shape=(2, 3, 5)))
+
+
+def test_cpu_int_epilogue(test, device):
+    # integer products are scaled in float64 and cast back when written to D
+    a = wp.array2d(np.ones(shape=(2, 3)), dtype=wp.int32, device=device)
+    b = wp.array2d(np.ones(shape=(3, 4)), dtype=wp.int32, device=device)
+    c = wp.array2d(np.ones(shape=(2, 4)), dtype=wp.int32, device=device)
+    d = wp.zeros_like(c)
+
+    wp.matmul(a, b, c, d, alpha=2.5, beta=1.5)
+    assert_np_equal(d.numpy(), np.full(shape=(2, 4), fill_value=9, dtype=np.int32))
+
+
 devices = get_test_devices()
 cuda_devices = get_selected_cuda_test_devices()
 
@@ -484,13 +608,18 @@ class TestMatmul(unittest.TestCase):
 
 
 # add_function_test(TestMatmul, "test_f16", test_f16, devices=devices)
+add_function_test(TestMatmul, "test_f16_accumulation", test_f16_accumulation, devices=devices)
 add_function_test(TestMatmul, "test_f32", test_f32, devices=devices)
+add_function_test(TestMatmul, "test_f32_allow_tf32", test_f32_allow_tf32, devices=devices)
 add_function_test(TestMatmul, "test_f64", test_f64, devices=devices)
+add_function_test(TestMatmul, "test_unaligned", test_unaligned, devices=devices)
 add_function_test(TestMatmul, "test_tape", test_tape, devices=devices)
 add_function_test(TestMatmul, "test_operator", test_operator, devices=devices)
 add_function_test(TestMatmul, "test_large_batch_count", test_large_batch_count, devices=devices)
 add_function_test(TestMatmul, "test_adjoint_accumulation", test_adjoint_accumulation, devices=devices)
 add_function_test(TestMatmul, "test_cuda_graph_capture", test_cuda_graph_capture, devices=cuda_devices)
+add_function_test(TestMatmul, "test_beta_zero_ignores_c", test_beta_zero_ignores_c, devices=devices)
+add_function_test(TestMatmul, "test_cpu_int_epilogue", test_cpu_int_epilogue, devices=["cpu"])
 
 
 if __name__ == "__main__":
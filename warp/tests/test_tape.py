@@ -6,6 +6,7 @@
 # license agreement from NVIDIA CORPORATION is strictly prohibited.
 
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -125,6 +126,35 @@ def test_tape_dot_product(test, device):
     assert_np_equal(tape.gradients[y].numpy(), x.numpy())
 
 
+def test_tape_skip_no_grad(test, device):
+    dim = 8
+    tape = wp.Tape()
+
+    # record onto tape
+    with tape:
+        x = wp.array(np.ones(dim), dtype=wp.float32, device=device, requires_grad=True)
+        y = wp.zeros_like(x, requires_grad=True)
+        wp.launch(kernel=mul_constant, dim=dim, inputs=[x], outputs=[y], device=device)
+
+        # no gradients flow through this launch since none of its arrays require them
+        a = wp.array(np.ones(dim), dtype=wp.float32, device=device)
+        b = wp.zeros_like(a)
+        wp.launch(kernel=mul_constant, dim=dim, inputs=[a], outputs=[b], device=device)
+
+    y.grad.fill_(1.0)
+
+    # record the launches issued by the tape
+    with mock.patch.object(wp, "launch", wraps=wp.launch) as launch:
+        tape.backward()
+
+    # only the launch on x and y is replayed backwards
+    adjoint_calls = [call for call in launch.call_args_list if call.kwargs.get("adjoint")]
+    test.assertEqual(len(adjoint_calls), 1)
+    test.assertIs(adjoint_calls[0].kwargs["inputs"][0], x)
+
+    assert_np_equal(x.grad.numpy(), np.ones(dim) * 2.0)
+
+
 def test_tape_visualize(test, device):
     dim = 8
     tape = wp.Tape()
@@ -163,6 +193,7 @@ class TestTape(unittest.TestCase):
 add_function_test(TestTape, "test_tape_mul_constant", test_tape_mul_constant, devices=devices)
 add_function_test(TestTape, "test_tape_mul_variable", test_tape_mul_variable, devices=devices)
 add_function_test(TestTape, "test_tape_dot_product", test_tape_dot_product, devices=devices)
+add_function_test(TestTape, "test_tape_skip_no_grad", test_tape_skip_no_grad, devices=devices)
 add_function_test(TestTape, "test_tape_visualize", test_tape_visualize, devices=devices)
 
 
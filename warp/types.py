@@ -3819,6 +3819,9 @@ def matmul(
     """
     from warp.context import runtime
 
+    # read the TF32 setting once so that the backward pass uses the same precision as the forward pass
+    allow_tf32_arith = warp.config.allow_tf32
+
     device = a.device
 
     if b.device != device or c.device != device or d.device != device:
@@ -3849,13 +3852,24 @@ def matmul(
 
     if runtime.tape:
         runtime.tape.record_func(
-            backward=lambda: adj_matmul(a, b, c, a.grad, b.grad, c.grad, d.grad, alpha, beta, allow_tf32x3_arith),
+            backward=lambda: adj_matmul(
+                a, b, c, a.grad, b.grad, c.grad, d.grad, alpha, beta, allow_tf32x3_arith, allow_tf32_arith
+            ),
             arrays=[a, b, c, d],
         )
 
     # cpu fallback if no cuda devices found
     if device == "cpu":
-        d.assign(alpha * (a.numpy() @ b.numpy()) + beta * c.numpy())
+        # apply the epilogue in place on the product, integer products are promoted to float64
+        # first so that the result matches alpha * (a @ b) + beta * c before d.assign() casts it back
+        d_np = np.matmul(a.numpy(), b.numpy())
+        if not np.issubdtype(d_np.dtype, np.floating):
+            d_np = d_np.astype(np.float64)
+        if alpha != 1.0:
+            d_np *= alpha
+        if beta != 0.0:
+            d_np += beta * c.numpy()
+        d.assign(d_np)
         return
 
     cc = device.arch
@@ -3875,6 +3889,7 @@ def matmul(
         not a.is_transposed,
         not b.is_transposed,
         allow_tf32x3_arith,
+        allow_tf32_arith,
         1,
     )
     if not ret:
@@ -3892,6 +3907,7 @@ def adj_matmul(
     alpha: float = 1.0,
     beta: float = 0.0,
     allow_tf32x3_arith: builtins.bool = False,
+    allow_tf32_arith: Optional[builtins.bool] = None,
 ):
     """Computes the adjoint of a generic matrix-matrix multiplication (GEMM) of the form: `d = alpha * (a @ b) + beta * c`.
         note: the adjoint of parameter alpha is not included but can be computed as `adj_alpha = np.sum(np.concatenate(np.multiply(a @ b, adj_d)))`.
@@ -3909,9 +3925,14 @@ def adj_matmul(
         beta (float): parameter beta of GEMM
         allow_tf32x3_arith (bool): whether to use CUTLASS's 3xTF32 GEMMs, which enable accuracy similar to FP32
                                    while using Tensor Cores
+        allow_tf32_arith (bool): whether to use TF32 Tensor Core GEMMs for float32 inputs, defaults to
+                                 ``warp.config.allow_tf32`` if None
     """
     from warp.context import runtime
 
+    if allow_tf32_arith is None:
+        allow_tf32_arith = warp.config.allow_tf32
+
     device = a.device
 
     if (
@@ -3973,7 +3994,8 @@ def adj_matmul(
     if device == "cpu":
         adj_a.assign(alpha * np.matmul(adj_d.numpy(), b.numpy().transpose()) + adj_a.numpy())
         adj_b.assign(alpha * (a.numpy().transpose() @ adj_d.numpy()) + adj_b.numpy())
-        adj_c.assign(beta * adj_d.numpy() + adj_c.numpy())
+        if beta != 0.0:
+            adj_c.assign(beta * adj_d.numpy() + adj_c.numpy())
         return
 
     cc = device.arch
@@ -3996,6 +4018,7 @@ def adj_matmul(
             True,
             b.is_transposed,
             allow_tf32x3_arith,
+            allow_tf32_arith,
             1,
         )
         if not ret:
@@ -4017,6 +4040,7 @@ def adj_matmul(
             not b.is_transposed,
             False,
             allow_tf32x3_arith,
+            allow_tf32_arith,
             1,
         )
         if not ret:
@@ -4040,6 +4064,7 @@ def adj_matmul(
             a.is_transposed,
             True,
             allow_tf32x3_arith,
+            allow_tf32_arith,
             1,
         )
         if not ret:
@@ -4061,19 +4086,21 @@ def adj_matmul(
             False,
             not a.is_transposed,
             allow_tf32x3_arith,
+            allow_tf32_arith,
             1,
         )
         if not ret:
             raise RuntimeError("adj_matmul failed.")
 
-    # adj_c
-    warp.launch(
-        kernel=warp.utils.add_kernel_2d,
-        dim=adj_c.shape,
-        inputs=[adj_c, adj_d, adj_d.dtype(beta)],
-        device=device,
-        record_tape=False,
-    )
+    # adj_c, the epilogue term beta * C contributes no gradient when beta is zero
+    if beta != 0.0:
+        warp.launch(
+            kernel=warp.utils.add_kernel_2d,
+            dim=adj_c.shape,
+            inputs=[adj_c, adj_d, adj_d.dtype(beta)],
+            device=device,
+            record_tape=False,
+        )
 
 
 def batched_matmul(
@@ -4099,6 +4126,9 @@ def batched_matmul(
     """
     from warp.context import runtime
 
+    # read the TF32 setting once so that the backward pass uses the same precision as the forward pass
+    allow_tf32_arith = warp.config.allow_tf32
+
     device = a.device
 
     if b.device != device or c.device != device or d.device != device:
@@ -4131,25 +4161,31 @@ def batched_matmul(
     if runtime.tape:
         runtime.tape.record_func(
             backward=lambda: adj_batched_matmul(
-                a, b, c, a.grad, b.grad, c.grad, d.grad, alpha, beta, allow_tf32x3_arith
+                a, b, c, a.grad, b.grad, c.grad, d.grad, alpha, beta, allow_tf32x3_arith, allow_tf32_arith
             ),
             arrays=[a, b, c, d],
         )
 
     # cpu fallback if no cuda devices found
     if device == "cpu":
-        d.assign(alpha * np.matmul(a.numpy(), b.numpy()) + beta * c.numpy())
+        # apply the epilogue in place on the product, integer products are promoted to float64
+        # first so that the result matches alpha * (a @ b) + beta * c before d.assign() casts it back
+        d_np = np.matmul(a.numpy(), b.numpy())
+        if not np.issubdtype(d_np.dtype, np.floating):
+            d_np = d_np.astype(np.float64)
+        if alpha != 1.0:
+            d_np *= alpha
+        if beta != 0.0:
+            d_np += beta * c.numpy()
+        d.assign(d_np)
         return
 
     # handle case in which batch_count exceeds max_batch_count, which is a CUDA array size maximum
     max_batch_count = 65535
-    iters = int(batch_count / max_batch_count)
-    remainder = batch_count % max_batch_count
 
     cc = device.arch
-    for i in range(iters):
-        idx_start = i * max_batch_count
-        idx_end = (i + 1) * max_batch_count if i < iters - 1 else batch_count
+    for idx_start in range(0, batch_count, max_batch_count):
+        idx_end = min(idx_start + max_batch_count, batch_count)
         ret = runtime.core.cutlass_gemm(
             device.context,
             cc,
@@ -4166,33 +4202,12 @@ def batched_matmul(
             not a.is_transposed,
             not b.is_transposed,
             allow_tf32x3_arith,
-            max_batch_count,
+            allow_tf32_arith,
+            idx_end - idx_start,
         )
         if not ret:
             raise RuntimeError("Batched matmul failed.")
 
-    idx_start = iters * max_batch_count
-    ret = runtime.core.cutlass_gemm(
-        device.context,
-        cc,
-        m,
-        n,
-        k,
-        type_typestr(a.dtype).encode(),
-        ctypes.c_void_p(a[idx_start:, :, :].ptr),
-        ctypes.c_void_p(b[idx_start:, :, :].ptr),
-        ctypes.c_void_p(c[idx_start:, :, :].ptr),
-        ctypes.c_void_p(d[idx_start:, :, :].ptr),
-        alpha,
-        beta,
-        not a.is_transposed,
-        not b.is_transposed,
-        allow_tf32x3_arith,
-        remainder,
-    )
-    if not ret:
-        raise RuntimeError("Batched matmul failed.")
-
 
 def adj_batched_matmul(
     a: array3d,
@@ -4205,6 +4220,7 @@ def adj_batched_matmul(
     alpha: float = 1.0,
     beta: float = 0.0,
     allow_tf32x3_arith: builtins.bool = False,
+    allow_tf32_arith: Optional[builtins.bool] = None,
 ):
     """Computes the adjoint of a batched generic matrix-matrix multiplication (GEMM) of the form: `d = alpha * (a @ b) + beta * c`.
 
@@ -4220,9 +4236,14 @@ def adj_batched_matmul(
         beta (float): parameter beta of GEMM
         allow_tf32x3_arith (bool): whether to use CUTLASS's 3xTF32 GEMMs, which enable accuracy similar to FP32
                                    while using Tensor Cores
+        allow_tf32_arith (bool): whether to use TF32 Tensor Core GEMMs for float32 inputs, defaults to
+                                 ``warp.config.allow_tf32`` if None
     """
     from warp.context import runtime
 
+    if allow_tf32_arith is None:
+        allow_tf32_arith = warp.config.allow_tf32
+
     device = a.device
 
     if (
@@ -4284,19 +4305,17 @@ def adj_batched_matmul(
     if device == "cpu":
         adj_a.assign(alpha * np.matmul(adj_d.numpy(), b.numpy().transpose((0, 2, 1))) + adj_a.numpy())
         adj_b.assign(alpha * np.matmul(a.numpy().transpose((0, 2, 1)), adj_d.numpy()) + adj_b.numpy())
-        adj_c.assign(beta * adj_d.numpy() + adj_c.numpy())
+        if beta != 0.0:
+            adj_c.assign(beta * adj_d.numpy() + adj_c.numpy())
         return
 
     # handle case in which batch_count exceeds max_batch_count, which is a CUDA array size maximum
     max_batch_count = 65535
-    iters = int(batch_count / max_batch_count)
-    remainder = batch_count % max_batch_count
 
     cc = device.arch
 
-    for i in range(iters):
-        idx_start = i * max_batch_count
-        idx_end = (i + 1) * max_batch_count if i < iters - 1 else batch_count
+    for idx_start in range(0, batch_count, max_batch_count):
+        idx_end = min(idx_start + max_batch_count, batch_count)
 
         # adj_a
         if not a.is_transposed:
@@ -4316,7 +4335,8 @@ def adj_batched_matmul(
                 True,
                 b.is_transposed,
                 allow_tf32x3_arith,
-                max_batch_count,
+                allow_tf32_arith,
+                idx_end - idx_start,
             )
             if not ret:
                 raise RuntimeError("adj_matmul failed.")
@@ -4337,7 +4357,8 @@ def adj_batched_matmul(
                 not b.is_transposed,
                 False,
                 allow_tf32x3_arith,
-                max_batch_count,
+                allow_tf32_arith,
+                idx_end - idx_start,
             )
             if not ret:
                 raise RuntimeError("adj_matmul failed.")
@@ -4360,7 +4381,8 @@ def adj_batched_matmul(
                 a.is_transposed,
                 True,
                 allow_tf32x3_arith,
-                max_batch_count,
+                allow_tf32_arith,
+                idx_end - idx_start,
             )
             if not ret:
                 raise RuntimeError("adj_matmul failed.")
@@ -4381,109 +4403,21 @@ def adj_batched_matmul(
                 False,
                 not a.is_transposed,
                 allow_tf32x3_arith,
-                max_batch_count,
+                allow_tf32_arith,
+                idx_end - idx_start,
             )
             if not ret:
                 raise RuntimeError("adj_matmul failed.")
 
-    idx_start = iters * max_batch_count
-
-    # adj_a
-    if not a.is_transposed:
-        ret = runtime.core.cutlass_gemm(
-            device.context,
-            cc,
-            m,
-            k,
-            n,
-            type_typestr(a.dtype).encode(),
-            ctypes.c_void_p(adj_d[idx_start:, :, :].ptr),
-            ctypes.c_void_p(b[idx_start:, :, :].ptr),
-            ctypes.c_void_p(adj_a[idx_start:, :, :].ptr),
-            ctypes.c_void_p(adj_a[idx_start:, :, :].ptr),
-            alpha,
-            1.0,
-            True,
-            b.is_transposed,
-            allow_tf32x3_arith,
-            remainder,
-        )
-        if not ret:
-            raise RuntimeError("adj_matmul failed.")
-    else:
-        ret = runtime.core.cutlass_gemm(
-            device.context,
-            cc,
-            k,
-            m,
-            n,
-            type_typestr(a.dtype).encode(),
-            ctypes.c_void_p(b[idx_start:, :, :].ptr),
-            ctypes.c_void_p(adj_d[idx_start:, :, :].ptr),
-            ctypes.c_void_p(adj_a[idx_start:, :, :].ptr),
-            ctypes.c_void_p(adj_a[idx_start:, :, :].ptr),
-            alpha,
-            1.0,
-            not b.is_transposed,
-            False,
-            allow_tf32x3_arith,
-            remainder,
-        )
-        if not ret:
-            raise RuntimeError("adj_matmul failed.")
-
-    # adj_b
-    if not b.is_transposed:
-        ret = runtime.core.cutlass_gemm(
-            device.context,
-            cc,
-            k,
-            n,
-            m,
-            type_typestr(a.dtype).encode(),
-            ctypes.c_void_p(a[idx_start:, :, :].ptr),
-            ctypes.c_void_p(adj_d[idx_start:, :, :].ptr),
-            ctypes.c_void_p(adj_b[idx_start:, :, :].ptr),
-            ctypes.c_void_p(adj_b[idx_start:, :, :].ptr),
-            alpha,
-            1.0,
-            a.is_transposed,
-            True,
-            allow_tf32x3_arith,
-            remainder,
-        )
-        if not ret:
-            raise RuntimeError("adj_matmul failed.")
-    else:
-        ret = runtime.core.cutlass_gemm(
-            device.context,
-            cc,
-            n,
-            k,
-            m,
-            type_typestr(a.dtype).encode(),
-            ctypes.c_void_p(adj_d[idx_start:, :, :].ptr),
-            ctypes.c_void_p(a[idx_start:, :, :].ptr),
-            ctypes.c_void_p(adj_b[idx_start:, :, :].ptr),
-            ctypes.c_void_p(adj_b[idx_start:, :, :].ptr),
-            alpha,
-            1.0,
-            False,
-            not a.is_transposed,
-            allow_tf32x3_arith,
-            remainder,
+    # adj_c, the epilogue term beta * C contributes no gradient when beta is zero
+    if beta != 0.0:
+        warp.launch(
+            kernel=warp.utils.add_kernel_3d,
+            dim=adj_c.shape,
+            inputs=[adj_c, adj_d, adj_d.dtype(beta)],
+            device=device,
+            record_tape=False,
         )
-        if not ret:
-            raise RuntimeError("adj_matmul failed.")
-
-    # adj_c
-    warp.launch(
-        kernel=warp.utils.add_kernel_3d,
-        dim=adj_c.shape,
-        inputs=[adj_c, adj_d, adj_d.dtype(beta)],
-        device=device,
-        record_tape=False,
-    )
 
 
 class HashGrid: